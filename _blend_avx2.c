@@ -0,0 +1,98 @@
+/* AVX2 overlay blend on packed uint8 RGB, fixed-point throughout.
+ *
+ * Build:
+ *     cc -O3 -mavx2 -shared -fPIC -o _blend_avx2.so _blend_avx2.c
+ *
+ * app.py loads this via ctypes and falls back to the Cython/Numba/NumPy
+ * blend paths when the library is missing. Compiling without -mavx2
+ * still works; only the scalar path is emitted then.
+ */
+#include <stddef.h>
+#include <stdint.h>
+
+/* (x + 128 + ((x + 128) >> 8)) >> 8 == round(x / 255) for x <= 65152 */
+static inline uint32_t div255_scalar(uint32_t x)
+{
+    x += 128;
+    return (x + (x >> 8)) >> 8;
+}
+
+static void overlay_scalar(const uint8_t *f, const uint8_t *p, uint8_t *out,
+                           size_t start, size_t n, uint8_t opacity)
+{
+    size_t i;
+    for (i = start; i < n; i++) {
+        uint32_t fv = f[i];
+        uint32_t pv = p[i];
+        uint32_t b = fv < 128
+            ? 2 * div255_scalar(fv * pv)
+            : 255 - 2 * div255_scalar((255 - fv) * (255 - pv));
+        out[i] = (uint8_t)div255_scalar(fv * (255 - opacity) + b * opacity);
+    }
+}
+
+#if defined(__AVX2__)
+#include <immintrin.h>
+
+static inline __m256i div255_u16(__m256i x)
+{
+    const __m256i v128 = _mm256_set1_epi16(128);
+    x = _mm256_add_epi16(x, v128);
+    x = _mm256_add_epi16(x, _mm256_srli_epi16(x, 8));
+    return _mm256_srli_epi16(x, 8);
+}
+
+/* Overlay on 16 widened pixels: pick 2*f*p/255 or 255 - 2*(255-f)*(255-p)/255
+ * per lane. The discarded candidate may exceed 255 in its lane; blendv
+ * throws it away before packing. */
+static inline __m256i overlay_u16(__m256i f, __m256i p)
+{
+    const __m256i v255 = _mm256_set1_epi16(255);
+    const __m256i v127 = _mm256_set1_epi16(127);
+    __m256i low = _mm256_slli_epi16(div255_u16(_mm256_mullo_epi16(f, p)), 1);
+    __m256i invf = _mm256_sub_epi16(v255, f);
+    __m256i invp = _mm256_sub_epi16(v255, p);
+    __m256i high = _mm256_sub_epi16(
+        v255, _mm256_slli_epi16(div255_u16(_mm256_mullo_epi16(invf, invp)), 1));
+    __m256i mask = _mm256_cmpgt_epi16(f, v127);
+    return _mm256_blendv_epi8(low, high, mask);
+}
+
+void overlay_avx2(const uint8_t *f, const uint8_t *p, uint8_t *out,
+                  size_t n, uint8_t opacity)
+{
+    const __m256i zero = _mm256_setzero_si256();
+    const __m256i va = _mm256_set1_epi16(opacity);
+    const __m256i vina = _mm256_set1_epi16(255 - opacity);
+    size_t i = 0;
+    for (; i + 32 <= n; i += 32) {
+        __m256i vf = _mm256_loadu_si256((const __m256i *)(f + i));
+        __m256i vp = _mm256_loadu_si256((const __m256i *)(p + i));
+        /* unpack u8 -> u16; lo/hi interleave within 128-bit lanes is
+         * undone symmetrically by packus below */
+        __m256i flo = _mm256_unpacklo_epi8(vf, zero);
+        __m256i fhi = _mm256_unpackhi_epi8(vf, zero);
+        __m256i plo = _mm256_unpacklo_epi8(vp, zero);
+        __m256i phi = _mm256_unpackhi_epi8(vp, zero);
+        __m256i blo = overlay_u16(flo, plo);
+        __m256i bhi = overlay_u16(fhi, phi);
+        /* composite: (f*(255-a) + b*a) / 255 */
+        blo = div255_u16(_mm256_add_epi16(_mm256_mullo_epi16(flo, vina),
+                                          _mm256_mullo_epi16(blo, va)));
+        bhi = div255_u16(_mm256_add_epi16(_mm256_mullo_epi16(fhi, vina),
+                                          _mm256_mullo_epi16(bhi, va)));
+        _mm256_storeu_si256((__m256i *)(out + i),
+                            _mm256_packus_epi16(blo, bhi));
+    }
+    overlay_scalar(f, p, out, i, n, opacity);
+}
+
+#else
+
+void overlay_avx2(const uint8_t *f, const uint8_t *p, uint8_t *out,
+                  size_t n, uint8_t opacity)
+{
+    overlay_scalar(f, p, out, 0, n, opacity);
+}
+
+#endif
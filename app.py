@@ -1,3 +1,8 @@
+import ctypes
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import numpy as np
 import matplotlib.pyplot as plt
 from PIL import Image
@@ -6,6 +11,152 @@ import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 from ttkthemes import ThemedTk
 
+# Working-set budget for one cache-blocked blend strip; sized to fit
+# comfortably in a typical per-core L2
+_L2_TARGET_BYTES = 1 << 20
+
+# Handwritten AVX2 overlay kernel, built from _blend_avx2.c (see the
+# build line in that file). Processes 32 packed uint8 values per
+# iteration in integer fixed point.
+try:
+    _AVX2_LIB = ctypes.CDLL(os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "_blend_avx2.so"))
+    _AVX2_LIB.overlay_avx2.argtypes = [
+        ctypes.POINTER(ctypes.c_uint8), ctypes.POINTER(ctypes.c_uint8),
+        ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t, ctypes.c_uint8]
+    _AVX2_LIB.overlay_avx2.restype = None
+except OSError:
+    _AVX2_LIB = None
+
+try:
+    # Compiled Cython kernels, built via `python setup.py build_ext --inplace`
+    import _blend_modes
+    CEXT_AVAILABLE = True
+except ImportError:
+    CEXT_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Fall back to the NumPy blend path if numba is not installed
+    NUMBA_AVAILABLE = False
+
+
+if CEXT_AVAILABLE:
+    _CEXT_KERNELS = {
+        "overlay": _blend_modes.overlay_u8,
+        "multiply": _blend_modes.multiply_u8,
+        "screen": _blend_modes.screen_u8,
+    }
+
+
+# Integer codes for the blend modes, so specialized kernels can branch
+# on a compile-time constant instead of comparing strings per call
+_MODE_CODES = {"overlay": 0, "multiply": 1, "screen": 2}
+
+
+if NUMBA_AVAILABLE:
+    @lru_cache(maxsize=None)
+    def _get_numba_kernel(mode_code, has_alpha):
+        """Build an @njit kernel specialized to one (mode, alpha) combination.
+
+        mode_code and has_alpha are closed over as Python constants, so
+        LLVM folds both branches away and compiles each combination to
+        straight-line SIMD code. lru_cache hands back the compiled
+        kernel on every later call.
+
+        The explicit signature forces compilation here rather than on
+        the first blend, and cache=True persists the machine code to
+        disk so later runs pay a load, not a compile.
+        """
+        @njit('void(u1[:, :, ::1], u1[:, :, ::1], u1[:, ::1], f4, u1[:, :, ::1])',
+              parallel=True, fastmath=True, cache=True, boundscheck=False)
+        def kernel(fabric, print_rgb, print_alpha, opacity, out):
+            h, w = fabric.shape[:2]
+            inv255 = np.float32(1.0 / 255.0)
+            for y in prange(h):
+                for x in range(w):
+                    if has_alpha:
+                        a = print_alpha[y, x] * inv255 * opacity
+                    else:
+                        a = opacity
+                    for c in range(3):
+                        f = fabric[y, x, c] * inv255
+                        p = print_rgb[y, x, c] * inv255
+                        if mode_code == 1:
+                            b = f * p
+                        elif mode_code == 2:
+                            b = 1.0 - (1.0 - f) * (1.0 - p)
+                        elif f < 0.5:
+                            b = 2.0 * f * p
+                        else:
+                            b = 1.0 - 2.0 * (1.0 - f) * (1.0 - p)
+                        out[y, x, c] = np.uint8(
+                            (f * (1.0 - a) + b * a) * 255.0 + 0.5)
+
+        return kernel
+
+    # Warm the default-mode kernels now so the user's first fusion
+    # never waits on the JIT; on later runs this is a disk-cache load
+    if not CEXT_AVAILABLE:
+        _get_numba_kernel(_MODE_CODES["overlay"], False)
+        _get_numba_kernel(_MODE_CODES["overlay"], True)
+
+
+def _blend_band_numpy(fabric, print_rgb, alpha_plane, blend_mode, opacity, out):
+    """Blend one horizontal band in uint16 fixed point, writing into out.
+
+    All products of two 8-bit values fit in uint16, so the whole band is
+    computed with integer SIMD and >>8 scaling — no float arrays at all.
+    """
+    f16 = fabric.astype(np.uint16)
+    p16 = print_rgb.astype(np.uint16)
+
+    # Apply blend mode formula
+    if blend_mode == "multiply":
+        blended = f16 * p16
+        np.right_shift(blended, 8, out=blended)
+    elif blend_mode == "screen":
+        blended = (255 - f16) * (255 - p16)
+        np.right_shift(blended, 8, out=blended)
+        np.subtract(255, blended, out=blended)
+    else:  # Overlay, also the default
+        # low = 2*f*p/255 where f < 128, high = 255 - 2*(255-f)*(255-p)/255
+        # elsewhere. high wraps around in the lanes where f < 128, but the
+        # masked copy discards exactly those lanes.
+        low = f16 * p16
+        np.right_shift(low, 8, out=low)
+        np.left_shift(low, 1, out=low)
+        high = (255 - f16) * (255 - p16)
+        np.right_shift(high, 8, out=high)
+        np.left_shift(high, 1, out=high)
+        np.subtract(255, high, out=high)
+        np.copyto(low, high, where=f16 >= 128)
+        blended = low
+
+    # Uniform opacity: one saturating SIMD call does the whole
+    # composite on uint8, with proper rounding instead of a >>8 bias
+    if alpha_plane is None:
+        blended_u8 = cv2.convertScaleAbs(blended)
+        cv2.addWeighted(fabric, 1.0 - opacity, blended_u8, opacity, 0.0,
+                        dst=out)
+        return
+
+    # Per-pixel alpha: (f*(255-a) + blended*a) >> 8 with a in [0, 255],
+    # writing into the arrays we already own
+    a8 = int(round(opacity * 255))
+    a16 = alpha_plane.astype(np.uint16)
+    np.multiply(a16, np.uint16(a8), out=a16)
+    np.right_shift(a16, 8, out=a16)
+    a16 = a16[:, :, None]
+    np.multiply(blended, a16, out=blended)
+    np.multiply(f16, 255 - a16, out=f16)
+    np.add(f16, blended, out=f16)
+    np.right_shift(f16, 8, out=f16)
+    out[...] = f16
+
+
 class SimpleFabricFusion:
     def __init__(self):
         self.fabric_image = None
@@ -13,6 +164,8 @@ class SimpleFabricFusion:
         self.blend_mode = "overlay"
         self.print_opacity = 0.7
         self.print_scale = 1.0
+        self._tile_cache = None
+        self._out_u8 = None
     
     def load_fabric(self, path):
         """Load and preprocess a fabric image."""
@@ -21,7 +174,7 @@ class SimpleFabricFusion:
         return fabric_img
     
     def load_print(self, path):
-        """Load and preprocess a print image."""
+        """Load a print image as contiguous (rgb, alpha_or_none) planes."""
         # Check if the print has an alpha channel (transparency)
         if path.lower().endswith(('png', 'PNG')):
             print_img = cv2.imread(path, cv2.IMREAD_UNCHANGED)
@@ -32,107 +185,183 @@ class SimpleFabricFusion:
         else:
             print_img = cv2.imread(path)
             print_img = cv2.cvtColor(print_img, cv2.COLOR_BGR2RGB)
-        return print_img
+
+        # Split once into contiguous planes so the blend stages get
+        # unit-stride channel data instead of strided RGBA slices
+        if print_img.shape[2] == 4:
+            return (np.ascontiguousarray(print_img[:, :, :3]),
+                    np.ascontiguousarray(print_img[:, :, 3]))
+        return print_img, None
     
-    def resize_print(self, print_img, fabric_shape, scale=1.0):
-        """Resize the print to match fabric dimensions with optional scaling."""
+    def resize_print(self, print_planes, fabric_shape, scale=1.0):
+        """Resize the print planes to match fabric dimensions with optional scaling."""
+        print_rgb, print_alpha = print_planes
         target_height, target_width = fabric_shape[:2]
-        
+
         # Apply scaling factor
         target_height = int(target_height * scale)
         target_width = int(target_width * scale)
-        
-        # Resize print
-        resized_print = cv2.resize(print_img, (target_width, target_height))
-        return resized_print
+
+        # Already the right size, nothing to do
+        if print_rgb.shape[:2] == (target_height, target_width):
+            return print_rgb, print_alpha
+
+        # INTER_AREA is both faster and alias-free when shrinking;
+        # INTER_LINEAR is the right choice when enlarging
+        src_height, src_width = print_rgb.shape[:2]
+        if target_height * target_width < src_height * src_width:
+            interp = cv2.INTER_AREA
+        else:
+            interp = cv2.INTER_LINEAR
+        rgb = cv2.resize(print_rgb, (target_width, target_height),
+                         interpolation=interp)
+        alpha = None
+        if print_alpha is not None:
+            alpha = cv2.resize(print_alpha, (target_width, target_height),
+                               interpolation=interp)
+        return rgb, alpha
     
-    def tile_print(self, print_img, fabric_shape):
-        """Tile the print to cover the entire fabric."""
+    def tile_print(self, print_planes, fabric_shape):
+        """Tile the print planes to cover the entire fabric."""
+        print_rgb, print_alpha = print_planes
         h, w = fabric_shape[:2]
-        print_h, print_w = print_img.shape[:2]
-        
-        # Calculate how many tiles needed
-        tiles_h = int(np.ceil(h / print_h))
-        tiles_w = int(np.ceil(w / print_w))
-        
-        # Create a canvas that's at least as large as the fabric
-        canvas_h = tiles_h * print_h
-        canvas_w = tiles_w * print_w
-        
-        # Initialize canvas with the appropriate number of channels
-        if print_img.shape[2] == 4:  # Has alpha channel
-            canvas = np.zeros((canvas_h, canvas_w, 4), dtype=print_img.dtype)
-        else:
-            canvas = np.zeros((canvas_h, canvas_w, 3), dtype=print_img.dtype)
-        
-        # Tile the print
-        for i in range(tiles_h):
-            for j in range(tiles_w):
-                y_start = i * print_h
-                y_end = (i + 1) * print_h
-                x_start = j * print_w
-                x_end = (j + 1) * print_w
-                canvas[y_start:y_end, x_start:x_end] = print_img
-        
-        # Crop to fabric size
-        tiled_print = canvas[:h, :w]
-        return tiled_print
+        print_h, print_w = print_rgb.shape[:2]
+
+        # Print already covers the fabric: just crop, no tiling needed
+        if print_h >= h and print_w >= w:
+            rgb = print_rgb[:h, :w].copy()
+            alpha = print_alpha[:h, :w].copy() if print_alpha is not None else None
+            return rgb, alpha
+
+        # Calculate how many tiles needed (integer ceil division, no
+        # float round trip through np.ceil)
+        tiles_h = -(-h // print_h)
+        tiles_w = -(-w // print_w)
+
+        # Tile each plane in C with block copies, then crop to fabric size
+        rgb = np.tile(print_rgb, (tiles_h, tiles_w, 1))[:h, :w]
+        alpha = None
+        if print_alpha is not None:
+            alpha = np.tile(print_alpha, (tiles_h, tiles_w))[:h, :w]
+        return rgb, alpha
     
-    def blend_images(self, fabric, print_img, blend_mode="overlay", opacity=0.7):
-        """Apply blend mode for combining fabric and print."""
-        # Check if print has alpha channel
-        has_alpha = print_img.shape[2] == 4
-        
-        # Extract RGB and alpha channels if needed
-        if has_alpha:
-            print_rgb = print_img[:, :, :3]
-            print_alpha = print_img[:, :, 3:4] / 255.0 * opacity
-        else:
-            print_rgb = print_img
-            
-        # Convert to float for blending calculations
-        fabric_norm = fabric / 255.0
-        print_norm = print_rgb / 255.0
-        
-        # Apply blend mode formula
-        if blend_mode == "overlay":
-            low = 2 * fabric_norm * print_norm
-            high = 1 - 2 * (1 - fabric_norm) * (1 - print_norm)
-            blended = np.where(fabric_norm < 0.5, low, high)
-        elif blend_mode == "multiply":
-            blended = fabric_norm * print_norm
-        elif blend_mode == "screen":
-            blended = 1 - (1 - fabric_norm) * (1 - print_norm)
-        else:  # Default to overlay
-            low = 2 * fabric_norm * print_norm
-            high = 1 - 2 * (1 - fabric_norm) * (1 - print_norm)
-            blended = np.where(fabric_norm < 0.5, low, high)
-        
-        # Apply alpha or opacity
-        if has_alpha:
-            result = fabric_norm * (1 - print_alpha) + blended * print_alpha
+    def blend_images(self, fabric, print_planes, blend_mode="overlay", opacity=0.7):
+        """Apply blend mode for combining fabric and print planes."""
+        print_rgb, alpha_plane = print_planes
+        has_alpha = alpha_plane is not None
+
+        # Fastest path: handwritten AVX2 fixed-point kernel over the
+        # flat RGB buffer (overlay with a uniform opacity only)
+        if (_AVX2_LIB is not None and not has_alpha
+                and blend_mode not in ("multiply", "screen")):
+            fabric_c = np.ascontiguousarray(fabric)
+            print_c = np.ascontiguousarray(print_rgb)
+            out = np.empty_like(fabric_c)
+            u8_p = ctypes.POINTER(ctypes.c_uint8)
+            _AVX2_LIB.overlay_avx2(
+                fabric_c.ctypes.data_as(u8_p), print_c.ctypes.data_as(u8_p),
+                out.ctypes.data_as(u8_p), out.size, int(round(opacity * 255)))
+            return out
+
+        # Fast path: fused single-pass compiled kernel, no float
+        # temporaries. Prefer the Cython extension, then Numba.
+        if CEXT_AVAILABLE or NUMBA_AVAILABLE:
+            if has_alpha:
+                print_alpha = np.ascontiguousarray(alpha_plane)
+            else:
+                print_alpha = np.empty((1, 1), dtype=np.uint8)
+            out = np.empty_like(fabric)
+            fabric_c = np.ascontiguousarray(fabric)
+            print_c = np.ascontiguousarray(print_rgb)
+            if CEXT_AVAILABLE:
+                kernel = _CEXT_KERNELS.get(blend_mode, _CEXT_KERNELS["overlay"])
+                kernel(fabric_c, print_c, print_alpha, has_alpha,
+                       np.float32(opacity), out)
+            else:
+                kernel = _get_numba_kernel(_MODE_CODES.get(blend_mode, 0),
+                                           has_alpha)
+                kernel(fabric_c, print_c, print_alpha, np.float32(opacity), out)
+            return out
+
+        # Fixed-point OpenCV path for multiply/screen without alpha:
+        # saturating SIMD on packed uint8, no float arrays at all
+        if not has_alpha and blend_mode in ("multiply", "screen"):
+            if blend_mode == "multiply":
+                blended_u8 = cv2.multiply(fabric, print_rgb, scale=1.0 / 255.0)
+            else:
+                inv_f = cv2.bitwise_not(fabric)
+                inv_p = cv2.bitwise_not(print_rgb)
+                blended_u8 = cv2.bitwise_not(
+                    cv2.multiply(inv_f, inv_p, scale=1.0 / 255.0))
+            return cv2.addWeighted(fabric, 1.0 - opacity, blended_u8, opacity, 0.0)
+
+        # NumPy fallback: blend in horizontal bands mapped over a thread
+        # pool. NumPy's ufunc loops release the GIL, so the bands run in
+        # parallel, and each band's float temporaries are band-sized
+        # rather than image-sized. The uint8 output buffer is reused
+        # across calls.
+        if self._out_u8 is None or self._out_u8.shape != fabric.shape:
+            self._out_u8 = np.empty(fabric.shape, dtype=np.uint8)
+        out = self._out_u8
+        h, w = fabric.shape[:2]
+        n_bands = min(os.cpu_count() or 1, h)
+
+        # Rows per strip so one strip's uint16 temporaries (about four
+        # HxWx3 arrays) stay L2-resident: every blend pass over a strip
+        # then reads from cache instead of DRAM
+        strip = max(1, _L2_TARGET_BYTES // (w * 3 * 2 * 4))
+
+        def blend_band(band):
+            y0, y1 = band
+            for ys in range(y0, y1, strip):
+                ye = min(ys + strip, y1)
+                a = alpha_plane[ys:ye] if has_alpha else None
+                _blend_band_numpy(fabric[ys:ye], print_rgb[ys:ye], a,
+                                  blend_mode, opacity, out[ys:ye])
+
+        bands = [(i * h // n_bands, (i + 1) * h // n_bands)
+                 for i in range(n_bands)]
+        if n_bands > 1:
+            with ThreadPoolExecutor(max_workers=n_bands) as ex:
+                list(ex.map(blend_band, bands))
         else:
-            result = fabric_norm * (1 - opacity) + blended * opacity
-            
-        return (result * 255).astype(np.uint8)
+            blend_band(bands[0])
+        return out
     
-    def generate_fusion(self, fabric_img, print_img, blend_mode, opacity, scale):
+    def generate_fusion(self, fabric_img, print_planes, blend_mode, opacity, scale):
         """Generate fused fabric with print."""
-        # Resize print based on scale
-        print_resized = self.resize_print(print_img, fabric_img.shape, scale)
-        
-        # Tile print to cover fabric
-        print_tiled = self.tile_print(print_resized, fabric_img.shape)
-        
+        # The tiled print only depends on the print, fabric size and
+        # scale, so opacity/blend-mode tweaks can reuse the cached
+        # tiling. The cache holds the planes object itself and compares
+        # by identity: a bare id() would dangle once the old planes were
+        # freed and its address reused for a new tuple.
+        cached = self._tile_cache
+        if (cached is not None and cached[0] is print_planes
+                and cached[1] == fabric_img.shape and cached[2] == scale):
+            print_tiled = cached[3]
+        else:
+            # Resize print based on scale
+            print_resized = self.resize_print(print_planes, fabric_img.shape, scale)
+
+            # Tile print to cover fabric
+            print_tiled = self.tile_print(print_resized, fabric_img.shape)
+            self._tile_cache = (print_planes, fabric_img.shape, scale, print_tiled)
+
         # Apply blend mode
         result = self.blend_images(fabric_img, print_tiled, blend_mode, opacity)
-            
+
         return result
     
     def save_fusion(self, output_path, fused_image):
         """Save the fused image to output path."""
-        fused_image_pil = Image.fromarray(fused_image)
-        fused_image_pil.save(output_path)
+        # OpenCV's encoders are faster than PIL's; a moderate PNG
+        # compression level trades a little file size for much less CPU
+        if output_path.lower().endswith(('.jpg', '.jpeg')):
+            params = [cv2.IMWRITE_JPEG_QUALITY, 92]
+        else:
+            params = [cv2.IMWRITE_PNG_COMPRESSION, 3]
+        cv2.imwrite(output_path, cv2.cvtColor(fused_image, cv2.COLOR_RGB2BGR),
+                    params)
 
 
 class SimpleFabricFusionGUI:
@@ -145,6 +374,12 @@ class SimpleFabricFusionGUI:
         self.fusion = SimpleFabricFusion()
         self.fabric_path = None
         self.print_path = None
+        self.preview_max_size = 512
+
+        # Single worker that runs fusions off the Tk event loop; the
+        # blend kernels release the GIL, so the UI stays live meanwhile
+        self._exec = ThreadPoolExecutor(max_workers=1)
+        self._pending_fusion = None
         
         self.setup_ui()
         
@@ -200,6 +435,7 @@ class SimpleFabricFusionGUI:
         self.opacity_label = ttk.Label(control_frame, text="0.7")
         self.opacity_label.grid(row=0, column=4, padx=5, pady=5)
         opacity_scale.configure(command=self.update_opacity_label)
+        opacity_scale.bind("<ButtonRelease-1>", self.on_slider_release)
         
         # Scale
         ttk.Label(control_frame, text="Pattern Scale:").grid(row=0, column=5, sticky=tk.W, padx=5, pady=5)
@@ -209,6 +445,7 @@ class SimpleFabricFusionGUI:
         self.scale_label = ttk.Label(control_frame, text="1.0")
         self.scale_label.grid(row=0, column=7, padx=5, pady=5)
         scale_scale.configure(command=self.update_scale_label)
+        scale_scale.bind("<ButtonRelease-1>", self.on_slider_release)
         
         # Buttons
         button_frame = ttk.Frame(self.bottom_frame, padding=10)
@@ -230,6 +467,21 @@ class SimpleFabricFusionGUI:
     def update_scale_label(self, value):
         """Update scale label when slider changes."""
         self.scale_label.configure(text=f"{float(value):.1f}")
+
+    def make_preview(self, img):
+        """Downsample an image once for interactive preview work."""
+        h, w = img.shape[:2]
+        longest = max(h, w)
+        if longest <= self.preview_max_size:
+            return img
+        ratio = self.preview_max_size / longest
+        return cv2.resize(img, (int(w * ratio), int(h * ratio)),
+                          interpolation=cv2.INTER_AREA)
+
+    def on_slider_release(self, event):
+        """Regenerate the fusion once a slider drag finishes."""
+        if hasattr(self, 'fabric_img') and hasattr(self, 'print_img'):
+            self.generate_fusion()
     
     def select_fabric(self):
         """Select a fabric image."""
@@ -241,7 +493,8 @@ class SimpleFabricFusionGUI:
         if file_path:
             self.fabric_path = file_path
             self.fabric_img = self.fusion.load_fabric(file_path)
-            self.display_image(self.fabric_img, self.fabric_canvas)
+            self.fabric_img_preview = self.make_preview(self.fabric_img)
+            self.display_image(self.fabric_img_preview, self.fabric_canvas)
     
     def select_print(self):
         """Select a print image."""
@@ -253,7 +506,15 @@ class SimpleFabricFusionGUI:
         if file_path:
             self.print_path = file_path
             self.print_img = self.fusion.load_print(file_path)
-            self.display_image(self.print_img, self.print_canvas)
+            rgb, alpha = self.print_img
+            rgb_preview = self.make_preview(rgb)
+            alpha_preview = self.make_preview(alpha) if alpha is not None else None
+            self.print_img_preview = (rgb_preview, alpha_preview)
+            if alpha_preview is not None:
+                self.display_image(np.dstack((rgb_preview, alpha_preview)),
+                                   self.print_canvas)
+            else:
+                self.display_image(rgb_preview, self.print_canvas)
     
     def display_image(self, img, canvas):
         """Display image on canvas."""
@@ -282,7 +543,9 @@ class SimpleFabricFusionGUI:
         new_width = int(img_width * ratio)
         new_height = int(img_height * ratio)
         
-        pil_img = pil_img.resize((new_width, new_height), Image.LANCZOS)
+        # BILINEAR is plenty for the display path and much cheaper than
+        # LANCZOS, which ran on every refresh
+        pil_img = pil_img.resize((new_width, new_height), Image.BILINEAR)
         
         # Convert to PhotoImage
         from PIL import ImageTk
@@ -305,20 +568,34 @@ class SimpleFabricFusionGUI:
         opacity = self.opacity_var.get()
         scale = self.scale_var.get()
         
-        # Generate fusion
-        result = self.fusion.generate_fusion(
-            self.fabric_img, 
-            self.print_img, 
-            blend_mode, 
-            opacity, 
+        # Generate fusion at preview resolution on the worker thread so
+        # the event loop never blocks; full resolution is only rendered
+        # when the result is saved. Cancel any job that has not started
+        # yet so slider drags don't queue up stale work.
+        if self._pending_fusion is not None:
+            self._pending_fusion.cancel()
+        future = self._exec.submit(
+            self.fusion.generate_fusion,
+            self.fabric_img_preview,
+            self.print_img_preview,
+            blend_mode,
+            opacity,
             scale
         )
-        
-        # Store result for saving
-        self.result_img = result
-        
+        self._pending_fusion = future
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_fusion_done, f))
+
+    def _on_fusion_done(self, future):
+        """Display a finished fusion result (runs on the Tk thread)."""
+        if future.cancelled():
+            return
+
+        # Store result so save_result knows a fusion exists
+        self.result_img = future.result()
+
         # Display result
-        self.display_image(result, self.result_canvas)
+        self.display_image(self.result_img, self.result_canvas)
     
     def save_result(self):
         """Save the fusion result."""
@@ -334,7 +611,16 @@ class SimpleFabricFusionGUI:
         )
         
         if file_path:
-            self.fusion.save_fusion(file_path, self.result_img)
+            # Re-run the fusion at full resolution for the saved file;
+            # the on-screen result is only preview-sized
+            result = self.fusion.generate_fusion(
+                self.fabric_img,
+                self.print_img,
+                self.blend_mode_var.get(),
+                self.opacity_var.get(),
+                self.scale_var.get()
+            )
+            self.fusion.save_fusion(file_path, result)
             messagebox.showinfo("Success", f"Saved fusion result to {file_path}")
 
 
@@ -0,0 +1,33 @@
+"""Build script for the optional Cython blend kernels.
+
+Usage:
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+The app runs without this; it just falls back to the Numba or NumPy
+blend path.
+"""
+import sys
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+if sys.platform == "win32":
+    omp_compile = ["/openmp", "/O2"]
+    omp_link = []
+else:
+    omp_compile = ["-fopenmp", "-O3"]
+    omp_link = ["-fopenmp"]
+
+setup(
+    name="fabricfusion-blend-modes",
+    ext_modules=cythonize([
+        Extension(
+            "_blend_modes",
+            ["_blend_modes.pyx"],
+            extra_compile_args=omp_compile,
+            extra_link_args=omp_link,
+        )
+    ]),
+)